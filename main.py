@@ -1,15 +1,20 @@
 import sys
 import os
 import re
+import heapq
+from collections import Counter
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QListWidget, QLabel, 
                              QMessageBox, QAbstractItemView, QRadioButton, QButtonGroup,
                              QSlider, QGroupBox, QLineEdit, QTabWidget, QCheckBox, QSizePolicy)
-from PyQt6.QtCore import Qt, QMimeData, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QMimeData, QThread, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QIntValidator, QIcon
 
-from sorter import sort_files
+from sorter import sort_files, file_sort_key
 from stitcher import stitch_images
 from grid_preview import PreviewDialog
 from slicer import slice_image, slice_grid_image
@@ -89,12 +94,18 @@ class PreviewListWidget(QListWidget):
         if self.preview_label:
             self.preview_label.hide()
 
-class StitcherThread(QThread):
+class TaskSignals(QObject):
     finished_signal = pyqtSignal(bool, str)
+    # Carries the executor whose worker died, so the app can replace it
+    pool_broken = pyqtSignal(object)
 
-    def __init__(self, image_paths, output_dir, split_count, target_width, max_kb, mode='vertical', rows=2, cols=2, output_format='AUTO', custom_name=None):
+class StitcherTask(QRunnable):
+    def __init__(self, executor, image_paths, output_dir, split_count, target_width, max_kb, mode='vertical', rows=2, cols=2, output_format='AUTO', custom_name=None):
         super().__init__()
-        self.image_paths = image_paths
+        self.signals = TaskSignals()
+        self.executor = executor
+        # Copy now, on the GUI thread: the app's list may change while the task runs
+        self.image_paths = list(image_paths)
         self.output_dir = output_dir
         self.split_count = split_count
         self.target_width = target_width
@@ -109,10 +120,16 @@ class StitcherThread(QThread):
 
     def run(self):
         try:
-            success, message = stitch_images(self.image_paths, self.output_dir, self.split_count, self.target_width, self.max_kb, self.mode, self.rows, self.cols, self.output_format, self.custom_name)
-            self.finished_signal.emit(success, message)
+            # Stitch in a worker process so Pillow never competes with the UI for the GIL;
+            # this thread only waits for the result and forwards it.
+            future = self.executor.submit(stitch_images, self.image_paths, self.output_dir, self.split_count, self.target_width, self.max_kb, self.mode, self.rows, self.cols, self.output_format, self.custom_name)
+            success, message = future.result()
+            self.signals.finished_signal.emit(success, message)
+        except BrokenProcessPool as e:
+            self.signals.pool_broken.emit(self.executor)
+            self.signals.finished_signal.emit(False, str(e))
         except Exception as e:
-            self.finished_signal.emit(False, str(e))
+            self.signals.finished_signal.emit(False, str(e))
 
 class MergerThread(QThread):
     finished_signal = pyqtSignal(bool, str)
@@ -172,12 +189,13 @@ class ConverterThread(QThread):
         except Exception as e:
             self.finished_signal.emit(False, str(e))
 
-class SlicerThread(QThread):
-    finished_signal = pyqtSignal(bool, str)
-
-    def __init__(self, image_paths, output_dir, count, smart_mode, target_width, max_kb, direction='horizontal', rows=None, cols=None, output_format='AUTO', custom_name=None):
+class SlicerTask(QRunnable):
+    def __init__(self, executor, image_paths, output_dir, count, smart_mode, target_width, max_kb, direction='horizontal', rows=None, cols=None, output_format='AUTO', custom_name=None):
         super().__init__()
-        self.image_paths = image_paths
+        self.signals = TaskSignals()
+        self.executor = executor
+        # Copy now, on the GUI thread: the app's list may change while the task runs
+        self.image_paths = list(image_paths)
         self.output_dir = output_dir
         self.count = count
         self.smart_mode = smart_mode
@@ -190,42 +208,120 @@ class SlicerThread(QThread):
         self.custom_name = custom_name
 
     def run(self):
-        success = True
-        message = ""
         try:
-            for i, img_path in enumerate(self.image_paths):
+            image_paths = self.image_paths
+            basenames = [os.path.basename(p) for p in image_paths]
+            
+            # Jobs run concurrently and each writes to output_dir/<stem>, so files sharing a stem
+            # (banner.jpg + banner.png, or 1.jpg from two folders) must get distinct names.
+            # Compared case-insensitively, as on Windows.
+            stems = [os.path.splitext(name)[0] for name in basenames]
+            stem_counts = Counter(stem.lower() for stem in stems)
+            
+            # Slicing is CPU-bound inside Pillow, so fan the files out across
+            # worker processes (threads would still serialize on the GIL).
+            futures = []
+            for i, img_path in enumerate(image_paths):
                 # Handle custom name for multiple files?
                 # If custom name is "MyPic", multiple input files might conflict or need indexing.
                 # Let's assume custom_name applies mainly to single file slicing or prefixing.
                 # If multiple files, we probably should append index to folder name or similar.
                 
                 c_name = self.custom_name
-                if c_name and len(self.image_paths) > 1:
+                if c_name and len(image_paths) > 1:
                      c_name = f"{c_name}_{i+1}"
-                     
-                if self.direction == 'grid':
-                    max_kb_val = self.max_kb if self.max_kb > 0 else None
-                    s, m = slice_grid_image(img_path, self.output_dir, self.rows, self.cols, self.target_width, max_kb_val, self.output_format, c_name)
-                else:
-                    max_kb_val = self.max_kb if self.max_kb > 0 else None
-                    s, m = slice_image(img_path, self.output_dir, self.count, self.smart_mode, self.target_width, max_kb_val, self.direction, self.output_format, c_name)
+                elif not c_name and stem_counts[stems[i].lower()] > 1:
+                     c_name = f"{stems[i]}_{i+1}"
                 
-                if not s:
-                    success = False
-                    message += f"\nFailed {os.path.basename(img_path)}: {m}"
+                max_kb_val = self.max_kb if self.max_kb > 0 else None
+                if self.direction == 'grid':
+                    future = self.executor.submit(slice_grid_image, img_path, self.output_dir, self.rows, self.cols, self.target_width, max_kb_val, self.output_format, c_name)
                 else:
-                    message += f"\nProcessed {os.path.basename(img_path)}: {m}"
+                    future = self.executor.submit(slice_image, img_path, self.output_dir, self.count, self.smart_mode, self.target_width, max_kb_val, self.direction, self.output_format, c_name)
+                futures.append(future)
+            
+            # Collect (index, ok, message) in submission order so the report matches the list order;
+            # names are resolved from basenames only when building the report
+            results = [(i, *future.result()) for i, future in enumerate(futures)]
+            success = all(ok for _, ok, _ in results)
+            message = "".join(
+                f"\n{'Processed' if ok else 'Failed'} {basenames[i]}: {m}" for i, ok, m in results
+            )
             
             if success:
                 message = "All images processed successfully!" + message
             else:
                 message = "Some images failed." + message
                 
-            self.finished_signal.emit(success, message)
+            self.signals.finished_signal.emit(success, message)
+        except BrokenProcessPool as e:
+            self.signals.pool_broken.emit(self.executor)
+            self.signals.finished_signal.emit(False, str(e))
         except Exception as e:
-            self.finished_signal.emit(False, str(e))
+            self.signals.finished_signal.emit(False, str(e))
+
+class DropScanSignals(QObject):
+    # (drop sequence number, tab index, files, error message or "")
+    finished_signal = pyqtSignal(int, int, list, str)
+
+class DropScanTask(QRunnable):
+    """
+    Collects the supported files from dropped paths (walking folders) on a pool thread.
+    Merge tab results are de-duplicated and sorted here too, before they reach the GUI.
+    """
+    def __init__(self, seq, tab_index, paths, valid_extensions):
+        super().__init__()
+        self.signals = DropScanSignals()
+        self.seq = seq
+        self.tab_index = tab_index
+        self.paths = paths
+        self.valid_extensions = valid_extensions
+
+    def run(self):
+        # Only the short suffix is lowercased, not the whole path
+        new_files = []
+        error = ""
+        try:
+            for path in self.paths:
+                if os.path.isfile(path) and os.path.splitext(path)[1].lower() in self.valid_extensions:
+                    new_files.append(path)
+                elif os.path.isdir(path):
+                    for root, _, filenames in os.walk(path):
+                        for fname in filenames:
+                            if os.path.splitext(fname)[1].lower() in self.valid_extensions:
+                                new_files.append(os.path.join(root, fname))
+            
+            if self.tab_index == 0: # Merge Tab
+                new_files = sort_files(list(dict.fromkeys(new_files)))
+        except Exception as e:
+            error = str(e)
+            if self.tab_index == 0: # Merge Tab
+                # Keep what was found, but the merge tab relies on receiving a sorted list
+                try:
+                    new_files = sort_files(list(dict.fromkeys(new_files)))
+                except Exception:
+                    new_files = []
+        
+        # Always report, even on error: later drops wait for this sequence number
+        self.signals.finished_signal.emit(self.seq, self.tab_index, new_files, error)
 
 class ImageMatrixApp(QMainWindow):
+    # Accepted drop suffixes (lowercase, with dot)
+    _IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.pdf'})
+    _CONVERT_EXTS = frozenset({'.pdf', '.psd', '.ppt', '.pptx'})
+
+    # Shared by all four drop labels
+    _DROP_STYLE = """
+            QLabel {
+                border: 2px dashed #aaa;
+                border-radius: 10px;
+                padding: 15px;
+                font-size: 14px;
+                color: #555;
+                background-color: #f0f0f0;
+            }
+        """
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ImageMatrix (影像矩阵) - 拼图 & 切图工具")
@@ -234,16 +330,39 @@ class ImageMatrixApp(QMainWindow):
         # Data storage
         self.merge_images = []
         self.slice_images = []
+        # Display names kept parallel to the path lists so basename() runs once per file
+        self.merge_basenames = []
+        self.slice_basenames = []
+        # Membership sidecars for O(1) duplicate checks on drop
+        self._merge_set = set()
+        self._slice_set = set()
         # Store full items in the widget for combine tab to support reordering
         # But we still need a list to track dropping? 
         # Actually for combine tab we update the widget directly with UserRole
         
-        self.stitch_thread = None
-        self.slicer_thread = None
+        self.stitch_task = None
+        self.slicer_task = None
         self.merger_thread = None
         self.converter_thread = None
         
         self.convert_files = []
+        
+        # Drop scans run in the background; results are applied in drop order (see on_drop_scanned)
+        self._drop_seq = 0
+        self._next_drop_to_apply = 0
+        self._pending_drops = {}
+        
+        # Last text set on each slider-driven label (see _set_text_if_changed)
+        self._last_label_text = {}
+
+        # One long-lived worker pool shared by stitching and slicing, so workers
+        # (and their Pillow imports) stay warm between runs
+        self._pool = None
+        
+        # Stitch/slice supervisors block on their process-pool futures for the whole job, so
+        # they get their own thread pool; drop scans keep the global one to themselves
+        self._task_pool = QThreadPool(self)
+        self._task_pool.setMaxThreadCount(2) # One stitch and one slice can run at once
 
         self.initUI()
 
@@ -285,7 +404,7 @@ class ImageMatrixApp(QMainWindow):
         # Drop Label
         self.merge_drop_label = QLabel("请将图片拖拽到此处\n(支持 .jpg, .jpeg, .png, .pdf)")
         self.merge_drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.merge_drop_label.setStyleSheet(self._get_drop_style())
+        self.merge_drop_label.setStyleSheet(self._DROP_STYLE)
         layout.addWidget(self.merge_drop_label)
 
         # List Widget
@@ -446,7 +565,7 @@ class ImageMatrixApp(QMainWindow):
         self.m_limit_slider.setValue(1)
         self.m_limit_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.m_limit_slider.setTickInterval(1)
-        self.m_limit_slider.valueChanged.connect(lambda v: self.update_limit_label(v, self.m_radio_limit_preset))
+        self.m_limit_slider.valueChanged.connect(self._on_merge_limit_changed)
         
         # When slider interacts, auto-check preset radio
         self.m_limit_slider.sliderPressed.connect(lambda: self.m_radio_limit_preset.setChecked(True))
@@ -487,7 +606,7 @@ class ImageMatrixApp(QMainWindow):
         self.m_split_slider = QSlider(Qt.Orientation.Horizontal)
         self.m_split_slider.setMinimum(1)
         self.m_split_slider.setMaximum(1)
-        self.m_split_slider.valueChanged.connect(lambda v: self.m_split_label.setText(f"拼接成：{v} 张图"))
+        self.m_split_slider.valueChanged.connect(self._on_split_changed)
         
         split_layout.addWidget(self.m_split_label)
         split_layout.addWidget(self.m_split_slider)
@@ -528,7 +647,7 @@ class ImageMatrixApp(QMainWindow):
         # Drop Label
         self.slice_drop_label = QLabel("请将图片拖拽到此处")
         self.slice_drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.slice_drop_label.setStyleSheet(self._get_drop_style())
+        self.slice_drop_label.setStyleSheet(self._DROP_STYLE)
         layout.addWidget(self.slice_drop_label)
 
         # List Widget
@@ -602,7 +721,7 @@ class ImageMatrixApp(QMainWindow):
         self.s_limit_slider.setValue(1)
         self.s_limit_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.s_limit_slider.setTickInterval(1)
-        self.s_limit_slider.valueChanged.connect(lambda v: self.update_limit_label(v, self.s_radio_limit_preset))
+        self.s_limit_slider.valueChanged.connect(self._on_slice_limit_changed)
         self.s_limit_slider.sliderPressed.connect(lambda: self.s_radio_limit_preset.setChecked(True))
 
         self.s_radio_limit_custom = QRadioButton("自定义:")
@@ -782,7 +901,7 @@ class ImageMatrixApp(QMainWindow):
         # Drop Label
         self.combine_drop_label = QLabel("请将文件或文件夹拖拽到此处\n(支持 .jpg, .png, .pdf)\n列表支持拖拽调整顺序")
         self.combine_drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.combine_drop_label.setStyleSheet(self._get_drop_style())
+        self.combine_drop_label.setStyleSheet(self._DROP_STYLE)
         layout.addWidget(self.combine_drop_label)
 
         # List Widget
@@ -829,7 +948,7 @@ class ImageMatrixApp(QMainWindow):
         self.c_limit_slider.setValue(1) # Default to index 1 -> 1MB? Or 0? Let's say 1
         self.c_limit_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.c_limit_slider.setTickInterval(1)
-        self.c_limit_slider.valueChanged.connect(lambda v: self.update_limit_label_new(v, self.c_limit_label))
+        self.c_limit_slider.valueChanged.connect(self._on_combine_limit_changed)
         
         limit_layout.addWidget(self.c_limit_label)
         limit_layout.addWidget(self.c_limit_slider)
@@ -875,7 +994,7 @@ class ImageMatrixApp(QMainWindow):
         # Drop Label
         self.convert_drop_label = QLabel("请将 PDF / PSD / PPT 文件拖拽到此处")
         self.convert_drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.convert_drop_label.setStyleSheet(self._get_drop_style())
+        self.convert_drop_label.setStyleSheet(self._DROP_STYLE)
         layout.addWidget(self.convert_drop_label)
         
         # List
@@ -925,18 +1044,6 @@ class ImageMatrixApp(QMainWindow):
         self.setup_list_actions(self.convert_list, self.delete_convert_items, lambda: None)
 
 
-    def _get_drop_style(self):
-        return """
-            QLabel {
-                border: 2px dashed #aaa;
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 14px;
-                color: #555;
-                background-color: #f0f0f0;
-            }
-        """
-
     def _get_group_style(self):
         return """
             QGroupBox {
@@ -982,13 +1089,15 @@ class ImageMatrixApp(QMainWindow):
         menu.exec(list_widget.mapToGlobal(pos))
 
     def delete_merge_items(self):
-        self._delete_items(self.merge_list, self.merge_images)
+        self._delete_items(self.merge_list, self.merge_images, self.merge_basenames)
+        self._merge_set = set(self.merge_images)
         self.m_split_slider.setMaximum(max(1, len(self.merge_images)))
 
     def delete_slice_items(self):
-        self._delete_items(self.slice_list, self.slice_images)
+        self._delete_items(self.slice_list, self.slice_images, self.slice_basenames)
+        self._slice_set = set(self.slice_images)
 
-    def _delete_items(self, list_widget, data_list):
+    def _delete_items(self, list_widget, data_list, name_list=None):
         items = list_widget.selectedItems()
         if not items:
             return
@@ -998,15 +1107,26 @@ class ImageMatrixApp(QMainWindow):
         
         for row in rows_to_delete:
             del data_list[row]
+            if name_list is not None:
+                del name_list[row]
             list_widget.takeItem(row)
 
     def rename_merge_items(self):
-        self._rename_items(self.merge_list, self.merge_images)
+        self._rename_items(self.merge_list, self.merge_images, self.merge_basenames)
+        self._merge_set = set(self.merge_images)
+        # A new name can change the sort position; drops rely on merge_images staying sorted
+        pairs = sorted(zip(self.merge_images, self.merge_basenames), key=lambda pair: file_sort_key(pair[0]))
+        paths = [path for path, _ in pairs]
+        if paths != self.merge_images:
+            self.merge_images = paths
+            self.merge_basenames = [name for _, name in pairs]
+            self.update_merge_list()
 
     def rename_slice_items(self):
-        self._rename_items(self.slice_list, self.slice_images)
+        self._rename_items(self.slice_list, self.slice_images, self.slice_basenames)
+        self._slice_set = set(self.slice_images)
 
-    def _rename_items(self, list_widget, data_list):
+    def _rename_items(self, list_widget, data_list, name_list=None):
         items = list_widget.selectedItems()
         if not items:
             return
@@ -1030,6 +1150,8 @@ class ImageMatrixApp(QMainWindow):
                 try:
                     os.rename(old_path, new_path)
                     data_list[row] = new_path
+                    if name_list is not None:
+                        name_list[row] = new_name
                     item.setText(new_name)
                 except OSError as e:
                     QMessageBox.warning(self, "错误", f"重命名失败: {e}")
@@ -1052,6 +1174,8 @@ class ImageMatrixApp(QMainWindow):
                     try:
                         os.rename(old_path, new_path)
                         data_list[row] = new_path
+                        if name_list is not None:
+                            name_list[row] = new_name
                         list_widget.item(row).setText(new_name)
                     except OSError as e:
                          # Continue renaming others even if one fails? Or stop? 
@@ -1089,9 +1213,9 @@ class ImageMatrixApp(QMainWindow):
     def update_limit_label_new(self, value, label_widget):
         mb = self._get_limit_mb(value)
         if mb == 0:
-            label_widget.setText("单页限制: 不限 (Unlimited)")
+            self._set_text_if_changed(label_widget, "单页限制: 不限 (Unlimited)")
         else:
-            label_widget.setText(f"单页限制: {mb} MB")
+            self._set_text_if_changed(label_widget, f"单页限制: {mb} MB")
 
     def update_limit_label(self, value, label_widget):
         # 0: Unlimited
@@ -1111,12 +1235,32 @@ class ImageMatrixApp(QMainWindow):
         kb_val = mapping.get(value, 0)
         
         if kb_val == 0:
-            label_widget.setText("预设: 无限制")
+            self._set_text_if_changed(label_widget, "预设: 无限制")
         else:
             if kb_val >= 1000:
-                label_widget.setText(f"预设: {kb_val/1000:.1f} MB")
+                self._set_text_if_changed(label_widget, f"预设: {kb_val/1000:.1f} MB")
             else:
-                label_widget.setText(f"预设: {kb_val} KB")
+                self._set_text_if_changed(label_widget, f"预设: {kb_val} KB")
+
+    def _set_text_if_changed(self, widget, text):
+        # Sliders emit on every tick while dragging; skip widgets whose text would not change
+        if self._last_label_text.get(widget) == text:
+            return
+        self._last_label_text[widget] = text
+        widget.setText(text)
+
+    # Slider slots (bound methods instead of per-connection lambdas)
+    def _on_merge_limit_changed(self, value):
+        self.update_limit_label(value, self.m_radio_limit_preset)
+
+    def _on_slice_limit_changed(self, value):
+        self.update_limit_label(value, self.s_radio_limit_preset)
+
+    def _on_combine_limit_changed(self, value):
+        self.update_limit_label_new(value, self.c_limit_label)
+
+    def _on_split_changed(self, value):
+        self._set_text_if_changed(self.m_split_label, f"拼接成：{value} 张图")
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -1129,37 +1273,65 @@ class ImageMatrixApp(QMainWindow):
         
         current_index = self.tabs.currentIndex()
         
-        # Define valid extensions based on tab
-        if current_index == 3: # Convert Tab
-             valid_extensions = ('.pdf', '.psd', '.ppt', '.pptx')
-        else:
-             valid_extensions = ('.jpg', '.jpeg', '.png', '.pdf')
-        
-        new_files = []
-        for path in files:
-            if os.path.isfile(path) and path.lower().endswith(valid_extensions):
-                new_files.append(path)
-            elif os.path.isdir(path):
-                for root, _, filenames in os.walk(path):
-                    for fname in filenames:
-                        if fname.lower().endswith(valid_extensions):
-                            new_files.append(os.path.join(root, fname))
+        # Scanning folders (and sorting) can take a while on big drops; do it off the GUI thread.
+        # Scans may finish out of order, so each drop gets a sequence number.
+        task = DropScanTask(self._drop_seq, current_index, files, self._get_valid_extensions(current_index))
+        self._drop_seq += 1
+        task.signals.finished_signal.connect(self.on_drop_scanned)
+        QThreadPool.globalInstance().start(task)
 
+    def _get_valid_extensions(self, tab_index):
+        # Define valid extensions based on tab
+        if tab_index == 3: # Convert Tab
+            return self._CONVERT_EXTS
+        return self._IMAGE_EXTS
+
+    def on_drop_scanned(self, seq, current_index, new_files, error):
+        # Hold results back until every earlier drop has been applied, so lists keep drop order
+        self._pending_drops[seq] = (current_index, new_files, error)
+        while self._next_drop_to_apply in self._pending_drops:
+            tab_index, files, scan_error = self._pending_drops.pop(self._next_drop_to_apply)
+            self._next_drop_to_apply += 1
+            # Add whatever was found first: the modal message box below lets later drops land
+            if files or not scan_error:
+                self._add_dropped_files(tab_index, files)
+            if scan_error:
+                QMessageBox.warning(self, "错误", f"读取拖入的文件时出错：\n{scan_error}")
+
+    def _add_dropped_files(self, current_index, new_files):
         if not new_files:
-            QMessageBox.warning(self, "无效文件", f"当前模式不支持该文件格式。\n仅支持: {valid_extensions}")
+            valid_extensions = self._get_valid_extensions(current_index)
+            QMessageBox.warning(self, "无效文件", f"当前模式不支持该文件格式。\n仅支持: {', '.join(sorted(valid_extensions))}")
             return
 
         if current_index == 0: # Merge Tab
-            combined_set = set(self.merge_images + new_files)
-            self.merge_images = sort_files(list(combined_set))
-            self.update_merge_list()
+            # merge_images is kept sorted and new_files arrives sorted, so just merge them in
+            fresh = [f for f in new_files if f not in self._merge_set]
+            self._merge_set.update(fresh)
+            fresh_names = [os.path.basename(f) for f in fresh]
+            if not fresh:
+                pass
+            elif not self.merge_images or file_sort_key(fresh[0]) >= file_sort_key(self.merge_images[-1]):
+                # Everything new sorts after the current list: just append the new rows
+                self.merge_images.extend(fresh)
+                self.append_merge_items(fresh_names)
+            else:
+                merged = list(heapq.merge(zip(self.merge_images, self.merge_basenames),
+                                          zip(fresh, fresh_names),
+                                          key=lambda pair: file_sort_key(pair[0])))
+                self.merge_images = [path for path, _ in merged]
+                self.merge_basenames = [name for _, name in merged]
+                self.update_merge_list()
             self.m_split_slider.setMaximum(max(1, len(self.merge_images)))
         elif current_index == 1: # Slice Tab
             # For slicing, order matters less, just append
+            fresh = []
             for img in new_files:
-                if img not in self.slice_images:
-                    self.slice_images.append(img)
-            self.update_slice_list()
+                if img not in self._slice_set:
+                    self._slice_set.add(img)
+                    fresh.append(img)
+            self.slice_images.extend(fresh)
+            self.append_slice_items([os.path.basename(f) for f in fresh])
         elif current_index == 2: # Combine Tab
             for img in new_files:
                 # Add to widget directly
@@ -1174,23 +1346,30 @@ class ImageMatrixApp(QMainWindow):
              self.update_convert_list()
 
     def update_merge_list(self):
+        # addItems inserts all rows in one model update instead of one per item
         self.merge_list.clear()
-        for path in self.merge_images:
-            self.merge_list.addItem(os.path.basename(path))
+        self.merge_list.addItems(self.merge_basenames)
 
-    def update_slice_list(self):
-        self.slice_list.clear()
-        for path in self.slice_images:
-            self.slice_list.addItem(os.path.basename(path))
+    def append_merge_items(self, basenames):
+        self.merge_basenames.extend(basenames)
+        self.merge_list.addItems(basenames)
+
+    def append_slice_items(self, basenames):
+        self.slice_basenames.extend(basenames)
+        self.slice_list.addItems(basenames)
 
     def clear_merge_list(self):
         self.merge_images = []
+        self.merge_basenames = []
+        self._merge_set = set()
         self.merge_list.clear()
         self.m_split_slider.setMaximum(1)
         self.m_split_slider.setValue(1)
 
     def clear_slice_list(self):
         self.slice_images = []
+        self.slice_basenames = []
+        self._slice_set = set()
         self.slice_list.clear()
 
     def clear_combine_list(self):
@@ -1299,6 +1478,24 @@ class ImageMatrixApp(QMainWindow):
             self.m_split_group.setTitle("分组拼接设置")
             self.m_split_slider.setEnabled(True)
 
+    def _get_pool(self):
+        if self._pool is None:
+            # Windows caps ProcessPoolExecutor at 61 workers
+            max_workers = min(os.cpu_count() or 1, 61)
+            self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def on_pool_broken(self, executor):
+        # A worker that crashes breaks the whole pool; drop it so the next run gets a fresh one
+        if executor is self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def closeEvent(self, event):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
     def start_stitching(self):
         if not self.merge_images:
             QMessageBox.warning(self, "提示", "请先添加图片！")
@@ -1370,9 +1567,10 @@ class ImageMatrixApp(QMainWindow):
         
         custom_name = self.m_name_input.text().strip()
         
-        self.stitch_thread = StitcherThread(self.merge_images, desktop_path, split_count, target_width, limit_val, mode, rows, cols, output_format, custom_name)
-        self.stitch_thread.finished_signal.connect(self.on_stitching_finished)
-        self.stitch_thread.start()
+        self.stitch_task = StitcherTask(self._get_pool(), self.merge_images, desktop_path, split_count, target_width, limit_val, mode, rows, cols, output_format, custom_name)
+        self.stitch_task.signals.pool_broken.connect(self.on_pool_broken)
+        self.stitch_task.signals.finished_signal.connect(self.on_stitching_finished)
+        self._task_pool.start(self.stitch_task)
 
     def on_stitching_finished(self, success, message):
         self.m_start_btn.setEnabled(True)
@@ -1475,9 +1673,10 @@ class ImageMatrixApp(QMainWindow):
         
         custom_name = self.s_name_input.text().strip()
 
-        self.slicer_thread = SlicerThread(self.slice_images, desktop_path, count, smart_mode, target_width, limit_val, direction, rows, cols, output_format, custom_name)
-        self.slicer_thread.finished_signal.connect(self.on_slicing_finished)
-        self.slicer_thread.start()
+        self.slicer_task = SlicerTask(self._get_pool(), self.slice_images, desktop_path, count, smart_mode, target_width, limit_val, direction, rows, cols, output_format, custom_name)
+        self.slicer_task.signals.pool_broken.connect(self.on_pool_broken)
+        self.slicer_task.signals.finished_signal.connect(self.on_slicing_finished)
+        self._task_pool.start(self.slicer_task)
 
     def on_slicing_finished(self, success, message):
         self.s_start_btn.setEnabled(True)
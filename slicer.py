@@ -39,6 +39,49 @@ def _is_boundary_solid(image, pos, axis='horizontal'):
     variance = sum(stat.var)
     return variance
 
+def _best_line(band, start_pos, target_pos, dist_weight):
+    """
+    band: (lines, pixels, channels) array of the search window, one line per candidate cut.
+    Returns the position of the line with the lowest summed channel variance
+    plus distance penalty, or -1 if band is empty.
+    """
+    n_lines, n_pixels, n_channels = band.shape
+    best_pos = -1
+    # Seeded from line 0 rather than inf: fastmath assumes no infinities
+    min_score = 0.0
+    for i in range(n_lines):
+        variance = 0.0
+        for ch in range(n_channels):
+            s = 0.0
+            sq = 0.0
+            for x in range(n_pixels):
+                v = float(band[i, x, ch])
+                s += v
+                sq += v * v
+            mean = s / n_pixels
+            variance += sq / n_pixels - mean * mean
+        pos = start_pos + i
+        weighted_score = variance + abs(pos - target_pos) * dist_weight
+        if i == 0 or weighted_score < min_score:
+            min_score = weighted_score
+            best_pos = pos
+    return best_pos
+
+# JIT-compiled _best_line: None until first use, False if numba/numpy are unavailable.
+# Imported lazily so only the slicing workers pay numba's import cost, not the GUI.
+_best_line_jit = None
+
+def _get_best_line_jit():
+    global _best_line_jit
+    if _best_line_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _best_line_jit = False
+        else:
+            _best_line_jit = njit(cache=True, fastmath=True)(_best_line)
+    return _best_line_jit or None
+
 def _find_best_cut(image, target_pos, axis='horizontal', search_range=50):
     """
     Finds the best coordinate to cut near target_pos within search_range.
@@ -54,6 +97,26 @@ def _find_best_cut(image, target_pos, axis='horizontal', search_range=50):
     # Distance weight
     DIST_WEIGHT = 0.1
 
+    best_line = _get_best_line_jit() if end_pos > start_pos else None
+    if best_line is not None:
+        import numpy as np
+        
+        # Read the whole search window once instead of cropping one line at a time
+        if axis == 'horizontal':
+            band = np.asarray(image.crop((0, start_pos, image.width, end_pos)))
+        else:
+            band = np.asarray(image.crop((start_pos, 0, end_pos, image.height)))
+            band = band.swapaxes(0, 1)
+        if band.ndim == 2:
+            band = band[:, :, np.newaxis]
+        if band.dtype == np.bool_:
+            # Mode '1': match ImageStat, which counts set pixels as 255
+            band = band.astype(np.uint8) * 255
+        # numba can't compile for non-native byte order (e.g. 'I;16B'); use the ImageStat loop below
+        if band.dtype.isnative:
+            pos = best_line(np.ascontiguousarray(band), start_pos, float(target_pos), DIST_WEIGHT)
+            return int(pos) if pos >= 0 else int(best_pos)
+
     for pos in range(start_pos, end_pos):
         variance = _is_boundary_solid(image, pos, axis)
         
@@ -92,11 +155,10 @@ def slice_grid_image(image_path, output_dir, rows, cols, target_width=None, max_
             
         specific_output_dir = os.path.join(output_dir, base_name)
         
-        if not os.path.exists(specific_output_dir):
-            try:
-                os.makedirs(specific_output_dir)
-            except OSError as e:
-                return False, f"Could not create folder '{base_name}': {e}"
+        try:
+            os.makedirs(specific_output_dir, exist_ok=True)
+        except OSError as e:
+            return False, f"Could not create folder '{base_name}': {e}"
         
         # Determine Extension
         ext = ".jpg" # Default
@@ -191,11 +253,10 @@ def slice_image(image_path, output_dir, count=1, smart_mode=False, target_width=
             base_name = custom_name
 
         specific_output_dir = os.path.join(output_dir, base_name)
-        if not os.path.exists(specific_output_dir):
-            try:
-                os.makedirs(specific_output_dir)
-            except OSError as e:
-                return False, f"Could not create folder '{base_name}': {e}"
+        try:
+            os.makedirs(specific_output_dir, exist_ok=True)
+        except OSError as e:
+            return False, f"Could not create folder '{base_name}': {e}"
 
         # Determine Extension
         ext = ".jpg" # Default
@@ -3,6 +3,36 @@ import os
 import io
 from PIL import Image
 
+# Write buffer (1 MiB) for formats Pillow writes through fp.write() in small pieces
+# (PNG chunks, PDF objects). JPEG encodes straight to the file descriptor, so it gains nothing.
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _remove_partial(output_path):
+    # Like Pillow does for paths: don't leave a truncated file behind on failure
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+
+def _save_buffered(image, output_path, fmt, **kwargs):
+    """
+    Encodes a PNG or PDF into a large-buffered output file.
+    """
+    f = open(output_path, "wb", buffering=WRITE_BUFFER_SIZE)
+    try:
+        with f:
+            image.save(f, fmt, **kwargs)
+    except Exception:
+        _remove_partial(output_path)
+        raise
+
+def _write_bytes(buf, output_path):
+    """
+    Writes an already-encoded BytesIO to output_path in one go.
+    """
+    with open(output_path, "wb") as f:
+        f.write(buf.getbuffer())
+
 def save_compressed_image(image, output_path, max_kb=None, output_format=None):
     """
     Saves an image to the output_path, attempting to keep the file size under max_kb.
@@ -43,7 +73,7 @@ def save_compressed_image(image, output_path, max_kb=None, output_format=None):
             resolution = float(dpi[0]) if isinstance(dpi, tuple) else float(dpi)
 
         if not max_kb or max_kb <= 0:
-            image.save(output_path, "PDF", resolution=resolution, quality=quality)
+            _save_buffered(image, output_path, "PDF", resolution=resolution, quality=quality)
             return
             
         target_bytes = max_kb * 1024
@@ -51,6 +81,7 @@ def save_compressed_image(image, output_path, max_kb=None, output_format=None):
         min_q = 10
         max_q = 95
         best_q = min_q
+        best_buf = None
         
         # Binary Search for Quality
         while min_q <= max_q:
@@ -61,19 +92,24 @@ def save_compressed_image(image, output_path, max_kb=None, output_format=None):
             
             if size <= target_bytes:
                 best_q = mid_q
+                best_buf = buf
                 min_q = mid_q + 1
             else:
                 max_q = mid_q - 1
-                
-        image.save(output_path, "PDF", resolution=resolution, quality=best_q)
+        
+        # Reuse the winning encode instead of encoding again
+        if best_buf is not None:
+            _write_bytes(best_buf, output_path)
+        else:
+            _save_buffered(image, output_path, "PDF", resolution=resolution, quality=best_q)
         return
 
     # PNG Logic (Lossless, ignore max_kb usually)
     if fmt == 'PNG':
         if dpi:
-            image.save(output_path, "PNG", optimize=True, dpi=dpi)
+            _save_buffered(image, output_path, "PNG", optimize=True, dpi=dpi)
         else:
-            image.save(output_path, "PNG", optimize=True)
+            _save_buffered(image, output_path, "PNG", optimize=True)
         return
 
     # JPEG Logic (Standard)
@@ -96,14 +132,14 @@ def save_compressed_image(image, output_path, max_kb=None, output_format=None):
         buf = io.BytesIO()
         image.save(buf, "JPEG", **save_kwargs)
         if buf.tell() <= target_bytes:
-            with open(output_path, "wb") as f:
-                f.write(buf.getvalue())
+            _write_bytes(buf, output_path)
             return
             
         # Binary search
         min_q = 5
         max_q = 90
         best_q = min_q
+        best_buf = None
         
         while min_q <= max_q:
             mid_q = (min_q + max_q) // 2
@@ -117,10 +153,16 @@ def save_compressed_image(image, output_path, max_kb=None, output_format=None):
             
             if buf.tell() <= target_bytes:
                 best_q = mid_q
+                best_buf = buf
                 min_q = mid_q + 1
             else:
                 max_q = mid_q - 1
         
+        # Reuse the winning encode instead of encoding again
+        if best_buf is not None:
+            _write_bytes(best_buf, output_path)
+            return
+        
         final_kwargs = save_kwargs.copy()
         final_kwargs['quality'] = best_q
         image.save(output_path, "JPEG", **final_kwargs)